@@ -1,5 +1,6 @@
 from warnings import warn
 
+import numpy as np
 import pytest
 
 import xgi
@@ -347,6 +348,36 @@ def test_add_simplices_from(edgelist5):
     }
 
 
+def test_add_simplices_from_arrays():
+    S1 = xgi.SimplicialComplex()
+    S1.add_simplices_from([[0, 1], [2, 3, 4], [1, 2, 3, 5]])
+    S2 = xgi.SimplicialComplex()
+    S2.add_simplices_from_arrays(
+        np.array([2, 3, 4]), np.array([0, 1, 2, 3, 4, 1, 2, 3, 5])
+    )
+    assert set(S2.nodes) == set(S1.nodes)
+    assert set(S2.edges.members()) == set(S1.edges.members())
+    assert S2.num_edges == S1.num_edges
+    assert S2.edges.members(0) == {0, 1}
+    assert S2.edges.members(2) == {1, 2, 3, 5}
+
+    # existing, repeated and empty simplices, other node IDs
+    S = xgi.SimplicialComplex([["a", "b"]])
+    S.add_simplices_from_arrays([3, 2, 0, 3], ["a", "b", "c", "b", "a", "c", "a", "b"])
+    assert S.edges.members(dtype=dict) == {
+        0: frozenset({"a", "b"}),
+        1: frozenset({"a", "b", "c"}),
+        2: frozenset({"a", "c"}),
+        3: frozenset({"b", "c"}),
+    }
+
+    S.add_simplices_from_arrays([], [])
+    assert S.num_edges == 4
+
+    with pytest.raises(XGIError):
+        S.add_simplices_from_arrays([2, 2], [1, 2, 3])
+
+
 def test_add_simplices_from_wrong_format():
     edges = [0, 1, 2]
     with pytest.raises(XGIError):
@@ -417,6 +448,20 @@ def test_copy(edgelist1):
     assert list(copy2.edges.members()) == list(H1.edges.members())
     assert H1._hypergraph == copy2._hypergraph
 
+    H2 = xgi.SimplicialComplex([[1, 2, 3]])
+    H2.set_node_attributes({1: {"name": "a"}})
+    H2.set_edge_attributes({0: {"weight": 2}})
+    copy3 = H2.copy()
+    assert copy3.nodes[1] == {"name": "a"}
+    assert copy3.edges[0] == {"weight": 2}
+    assert copy3.nodes.memberships() == H2.nodes.memberships()
+    H2.nodes[1]["name"] = "b"
+    H2.edges[0]["weight"] = 3
+    H2.remove_simplex_id(0)
+    assert copy3.nodes[1] == {"name": "a"}
+    assert copy3.edges[0] == {"weight": 2}
+    assert copy3.nodes.memberships() != H2.nodes.memberships()
+
 
 def test_duplicate_edges(edgelist1):
     H = xgi.SimplicialComplex(edgelist1)
@@ -496,6 +541,9 @@ def test_freeze(edgelist1):
     with pytest.raises(XGIError):
         SC.add_simplices_from([[1, 7], [7]])
 
+    with pytest.raises(XGIError):
+        SC.add_simplices_from_arrays([2], [1, 7])
+
     with pytest.raises(XGIError):
         SC.remove_node(1)
 
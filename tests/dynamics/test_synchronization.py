@@ -116,36 +116,36 @@ def test_simulate_simplicial_kuramoto():
 
     output = np.array(
         [
-            0.49621306,
-            0.60580058,
-            0.67907764,
-            0.72321992,
-            0.75639763,
-            0.78366991,
-            0.80717782,
-            0.82273716,
-            0.83467922,
-            0.84446529,
-            0.85249769,
-            0.85912003,
-            0.86461448,
-            0.86920235,
-            0.87305585,
-            0.87630931,
-            0.87906825,
-            0.88141629,
-            0.88342032,
-            0.88513433,
-            0.88660225,
-            0.88786016,
-            0.88893787,
-            0.88986022,
-            0.89064801,
-            0.89131879,
-            0.89188742,
-            0.89236657,
-            0.89276710,
-            0.89309833,
+            0.47383339,
+            0.57414070,
+            0.63515743,
+            0.67578818,
+            0.70819855,
+            0.73975423,
+            0.76567247,
+            0.78397083,
+            0.79872724,
+            0.80957966,
+            0.81776692,
+            0.82481752,
+            0.83700555,
+            0.84081620,
+            0.84793645,
+            0.85664545,
+            0.85968054,
+            0.86467925,
+            0.87111417,
+            0.87310773,
+            0.87479886,
+            0.87645657,
+            0.87798310,
+            0.87937096,
+            0.88062694,
+            0.88176010,
+            0.88278015,
+            0.88369688,
+            0.88451980,
+            0.88525785,
         ]
     )
 
@@ -60,6 +60,8 @@ def test_random_hypergraph():
         H1 = xgi.random_hypergraph(10, [1, 1.1])
     with pytest.raises(ValueError):
         H1 = xgi.random_hypergraph(10, [1, -2])
+    with pytest.raises(ValueError):
+        H1 = xgi.random_hypergraph(10**6, [0], order=4)
 
     # uniform
     H4 = xgi.random_hypergraph(10, [0.1], order=2, seed=1)
@@ -1,8 +1,17 @@
+import os
+from itertools import combinations
+
 import networkx as nx
+import numpy as np
 import pytest
 
 import xgi
 from xgi.exception import XGIError
+from xgi.generators.simplicial_complexes import (
+    _cached_random_flag_complex,
+    _gnp_csr,
+    _uniform_hash,
+)
 
 
 def test_flag_complex():
@@ -23,9 +32,9 @@ def test_flag_complex():
     assert S.edges.members() == simplices_3
 
     # ps
-    S1 = xgi.flag_complex(G, ps=[1], seed=42)
-    S2 = xgi.flag_complex(G, ps=[0.5], seed=42)
-    S3 = xgi.flag_complex(G, ps=[0], seed=42)
+    S1 = xgi.flag_complex(G, ps=[1], seed=1)
+    S2 = xgi.flag_complex(G, ps=[0.5], seed=1)
+    S3 = xgi.flag_complex(G, ps=[0], seed=1)
 
     assert S1.edges.members() == simplices_3
     assert S2.edges.members() == simplices_2
@@ -39,6 +48,55 @@ def test_flag_complex():
     assert S4.num_edges == S5.num_edges
     assert set(S4.edges.members()) == set(S5.edges.members())
 
+    # max_order
+    G2 = nx.complete_graph(5)
+    S6 = xgi.flag_complex(G2, max_order=None)
+    S7 = xgi.flag_complex(G2, max_order=4)
+    S8 = xgi.flag_complex(G2, max_order=2)
+    assert set(S6.edges.members()) == set(S7.edges.members())
+    assert S6.num_edges == 2**5 - 5 - 1
+    assert xgi.max_edge_order(S8) == 2
+
+
+def test_flag_complex_batches(monkeypatch):
+    G = nx.erdos_renyi_graph(40, 0.4, seed=1)
+    S1 = xgi.flag_complex(G, max_order=3, ps=[0.5, 0.5], seed=2)
+    S4 = xgi.flag_complex(G, max_order=3)
+
+    # maximal cliques are streamed in batches, and a subclique shared by
+    # maximal cliques of different batches gets the same draw
+    monkeypatch.setattr(xgi.generators.simplicial_complexes, "_CLIQUE_BATCH", 3)
+    S2 = xgi.flag_complex(G, max_order=3, ps=[0.5, 0.5], seed=2)
+    assert S1._edge == S2._edge
+
+    # and is promoted once, even if it is found in several batches
+    S5 = xgi.flag_complex(G, max_order=3)
+    assert S4._edge == S5._edge
+    S6 = xgi.flag_complex(G, max_order=3, ps=[1, 0], seed=2)
+    assert set(S6.edges.filterby("order", 2).members()) == set(
+        S5.edges.filterby("order", 2).members()
+    )
+    assert xgi.max_edge_order(S6) == 2
+
+    # about half of the triangles are filled
+    S3 = xgi.flag_complex(G, ps=[0.5], seed=2)
+    n_triangles = len(xgi.find_triangles(G))
+    n_filled = len(S3.edges.filterby("order", 2))
+    assert 0.4 * n_triangles < n_filled < 0.6 * n_triangles
+
+
+def test_uniform_hash():
+    rows = np.array([[0, 1, 2], [0, 1, 3], [0, 1, 2]])
+    u = _uniform_hash(rows, np.uint64(1))
+    assert u[0] == u[2]
+    assert u[0] != u[1]
+    assert not np.array_equal(u, _uniform_hash(rows, np.uint64(2)))
+
+    rows = np.arange(30000).reshape(-1, 3)
+    u = _uniform_hash(rows, np.uint64(1))
+    assert np.all((0 <= u) & (u < 1))
+    assert abs(u.mean() - 0.5) < 0.01
+
 
 def test_flag_complex_d2():
     G = nx.erdos_renyi_graph(15, 0.3, seed=3)
@@ -48,8 +106,17 @@ def test_flag_complex_d2():
 
     assert set(S.edges.members()) == set(S2.edges.members())
 
+    # p2
+    S3 = xgi.flag_complex_d2(G, p2=0)
+    assert set(S3.edges.members()) == set(map(frozenset, G.edges()))
+
+    S4 = xgi.flag_complex_d2(G, p2=0.5, seed=1)
+    S5 = xgi.flag_complex_d2(G, p2=0.5, seed=1)
+    assert S4._edge == S5._edge
+    assert S3.num_edges < S4.num_edges < S2.num_edges
+
 
-def test_random_simplicial_complex():
+def test_random_simplicial_complex(monkeypatch):
     # seed
     S1 = xgi.random_simplicial_complex(10, [0.1, 0.001], seed=1)
     S2 = xgi.random_simplicial_complex(10, [0.1, 0.001], seed=2)
@@ -58,45 +125,92 @@ def test_random_simplicial_complex():
     assert S1._edge != S2._edge
     assert S2._edge == S3._edge
 
+    # parallel sampling gives the same output
+    S1 = xgi.random_simplicial_complex(20, [0.1, 0.01, 0.001], seed=3)
+    S2 = xgi.random_simplicial_complex(20, [0.1, 0.01, 0.001], seed=3, n_jobs=2)
+    assert S1._edge == S2._edge
+    S3 = xgi.random_simplicial_complex(20, [0.1, 0.01, 0.001], seed=3, n_jobs=-1)
+    S4 = xgi.random_simplicial_complex(20, [0.1, 0.01, 0.001], seed=3, n_jobs=-1000)
+    assert S3._edge == S4._edge == S1._edge
+    S5 = xgi.random_simplicial_complex(
+        20, [0.1, 0.01, 0.001], seed=3, n_jobs=np.int64(2)
+    )
+    assert S5._edge == S1._edge
+
+    # unknown number of processors
+    monkeypatch.setattr(os, "cpu_count", lambda: None)
+    S6 = xgi.random_simplicial_complex(20, [0.1, 0.01, 0.001], seed=3, n_jobs=-2)
+    assert S6._edge == S1._edge
+
+    # extreme probabilities
+    S4 = xgi.random_simplicial_complex(6, [1, 1], seed=1)
+    assert set(S4.edges.members()) == set(
+        frozenset(e) for d in [2, 3] for e in combinations(range(6), d)
+    )
+    S5 = xgi.random_simplicial_complex(6, [0, 0], seed=1)
+    assert S5.num_nodes == 6
+    assert S5.num_edges == 0
+
     # wrong input
     with pytest.raises(ValueError):
         S1 = xgi.random_simplicial_complex(10, [1, 1.1])
     with pytest.raises(ValueError):
         S1 = xgi.random_simplicial_complex(10, [1, -2])
+    with pytest.raises(ValueError):
+        S1 = xgi.random_simplicial_complex(10, [0.1, 0.01], n_jobs=0)
+    with pytest.raises(ValueError):
+        S1 = xgi.random_simplicial_complex(10, [0.1, 0.01], n_jobs=1.5)
+    with pytest.raises(ValueError):
+        S1 = xgi.random_simplicial_complex(10**6, [0, 0, 0, 0])
 
 
 def test_random_flag_complex():
 
     S = xgi.random_flag_complex(10, 0.4, seed=2)
     simplices = {
+        frozenset({0, 1}),
+        frozenset({0, 2}),
         frozenset({0, 4}),
-        frozenset({0, 7}),
+        frozenset({0, 9}),
+        frozenset({1, 5}),
+        frozenset({1, 7}),
         frozenset({1, 8}),
+        frozenset({2, 3}),
+        frozenset({2, 4}),
         frozenset({2, 5}),
-        frozenset({2, 9}),
+        frozenset({2, 6}),
         frozenset({3, 5}),
-        frozenset({3, 6}),
-        frozenset({3, 7}),
-        frozenset({3, 8}),
+        frozenset({3, 9}),
         frozenset({4, 5}),
+        frozenset({4, 6}),
         frozenset({4, 7}),
-        frozenset({4, 8}),
+        frozenset({4, 9}),
+        frozenset({5, 6}),
+        frozenset({5, 9}),
         frozenset({6, 7}),
-        frozenset({6, 8}),
-        frozenset({7, 8}),
-        frozenset({0, 4, 7}),
-        frozenset({3, 6, 7}),
-        frozenset({3, 6, 8}),
-        frozenset({3, 7, 8}),
-        frozenset({4, 7, 8}),
-        frozenset({6, 7, 8}),
+        frozenset({6, 9}),
+        frozenset({8, 9}),
+        frozenset({0, 2, 4}),
+        frozenset({0, 4, 9}),
+        frozenset({2, 3, 5}),
+        frozenset({2, 4, 5}),
+        frozenset({2, 4, 6}),
+        frozenset({2, 5, 6}),
+        frozenset({3, 5, 9}),
+        frozenset({4, 5, 6}),
+        frozenset({4, 5, 9}),
+        frozenset({4, 6, 7}),
+        frozenset({4, 6, 9}),
+        frozenset({5, 6, 9}),
     }
 
     assert set(S.edges.members()) == simplices
 
     # max_order
     S = xgi.random_flag_complex(10, 0.4, seed=2, max_order=3)
-    assert set(S.edges.members()) == simplices.union({frozenset({3, 6, 7, 8})})
+    assert set(S.edges.members()) == simplices.union(
+        {frozenset({2, 4, 5, 6}), frozenset({4, 5, 6, 9})}
+    )
 
     # seed
     S1 = xgi.random_flag_complex(10, 0.1, seed=1)
@@ -106,6 +220,27 @@ def test_random_flag_complex():
     assert S1._edge != S2._edge
     assert S2._edge == S3._edge
 
+    # cache
+    _cached_random_flag_complex.cache_clear()
+    S4 = xgi.random_flag_complex(10, 0.1, seed=2, cache=True)
+    S5 = xgi.random_flag_complex(10, 0.1, seed=2, cache=True)
+    assert _cached_random_flag_complex.cache_info().hits == 1
+    assert S4._edge == S5._edge == S2._edge
+    assert S4.num_nodes == 10
+    S4.add_simplex([0, 1, 2, 3])
+    assert S5._edge == S2._edge
+
+    assert not S4.is_frozen
+
+    xgi.random_flag_complex(10, 0.1, seed=np.int64(2), cache=True)
+    assert _cached_random_flag_complex.cache_info().hits == 2
+    xgi.random_flag_complex(10, 0.1, cache=True)
+    rng = np.random.default_rng(2)
+    S6 = xgi.random_flag_complex(10, 0.5, seed=rng, cache=True)
+    S7 = xgi.random_flag_complex(10, 0.5, seed=rng, cache=True)
+    assert S6._edge != S7._edge
+    assert _cached_random_flag_complex.cache_info().currsize == 1
+
     # wrong input
     with pytest.raises(ValueError):
         S1 = xgi.random_flag_complex(10, 1.1)
@@ -117,27 +252,40 @@ def test_random_flag_complex_d2():
 
     S = xgi.random_flag_complex_d2(10, 0.4, seed=2)
     simplices = {
+        frozenset({0, 1}),
+        frozenset({0, 2}),
         frozenset({0, 4}),
-        frozenset({0, 7}),
+        frozenset({0, 9}),
+        frozenset({1, 5}),
+        frozenset({1, 7}),
         frozenset({1, 8}),
+        frozenset({2, 3}),
+        frozenset({2, 4}),
         frozenset({2, 5}),
-        frozenset({2, 9}),
+        frozenset({2, 6}),
         frozenset({3, 5}),
-        frozenset({3, 6}),
-        frozenset({3, 7}),
-        frozenset({3, 8}),
+        frozenset({3, 9}),
         frozenset({4, 5}),
+        frozenset({4, 6}),
         frozenset({4, 7}),
-        frozenset({4, 8}),
+        frozenset({4, 9}),
+        frozenset({5, 6}),
+        frozenset({5, 9}),
         frozenset({6, 7}),
-        frozenset({6, 8}),
-        frozenset({7, 8}),
-        frozenset({0, 4, 7}),
-        frozenset({3, 6, 7}),
-        frozenset({3, 6, 8}),
-        frozenset({3, 7, 8}),
-        frozenset({4, 7, 8}),
-        frozenset({6, 7, 8}),
+        frozenset({6, 9}),
+        frozenset({8, 9}),
+        frozenset({0, 2, 4}),
+        frozenset({0, 4, 9}),
+        frozenset({2, 3, 5}),
+        frozenset({2, 4, 5}),
+        frozenset({2, 4, 6}),
+        frozenset({2, 5, 6}),
+        frozenset({3, 5, 9}),
+        frozenset({4, 5, 6}),
+        frozenset({4, 5, 9}),
+        frozenset({4, 6, 7}),
+        frozenset({4, 6, 9}),
+        frozenset({5, 6, 9}),
     }
 
     assert set(S.edges.members()) == simplices
@@ -160,3 +308,23 @@ def test_random_flag_complex_d2():
         S1 = xgi.random_flag_complex_d2(10, 1.1)
     with pytest.raises(ValueError):
         S1 = xgi.random_flag_complex_d2(10, -2)
+
+
+def test_gnp_csr():
+    rng = np.random.default_rng(1)
+    indptr, indices = _gnp_csr(10, 0, rng)
+    assert indptr.tolist() == [0] * 11
+    assert len(indices) == 0
+
+    indptr, indices = _gnp_csr(5, 1, rng)
+    assert np.diff(indptr).tolist() == [4] * 5
+    assert indices.tolist() == [j for i in range(5) for j in range(5) if j != i]
+
+    # reproducibility and expected density
+    indptr1, indices1 = _gnp_csr(200, 0.1, np.random.default_rng(2))
+    indptr2, indices2 = _gnp_csr(200, 0.1, np.random.default_rng(2))
+    assert np.array_equal(indptr1, indptr2)
+    assert np.array_equal(indices1, indices2)
+    assert abs(len(indices1) / (200 * 199) - 0.1) < 0.01
+
+    assert _gnp_csr(1, 0.5, rng)[0].tolist() == [0, 0]
@@ -0,0 +1,142 @@
+import networkx as nx
+import numpy as np
+
+import xgi
+from xgi.utils._cliques import (
+    _packed_adjacency,
+    degeneracy_ordering,
+    find_cliques_fast,
+    graph_to_csr,
+    list_triangles,
+    max_cliques,
+)
+
+
+def test_graph_to_csr():
+    G = nx.Graph([("a", "b"), ("b", "c"), ("c", "c")])
+    G.add_node("d")
+
+    nodelist, indptr, indices = graph_to_csr(G)
+    assert nodelist == ["a", "b", "c", "d"]
+    assert indptr.tolist() == [0, 1, 3, 4, 4]
+    assert indices.tolist() == [1, 0, 2, 1]
+
+
+def test_list_triangles():
+    G = nx.Graph([(0, 1), (1, 2), (2, 0), (0, 3), (2, 3), (3, 4)])
+    _, indptr, indices = graph_to_csr(G)
+    triangles = list_triangles(indptr, indices)
+    assert triangles.tolist() == [[0, 1, 2], [0, 2, 3]]
+
+    G = nx.erdos_renyi_graph(30, 0.3, seed=1)
+    nodelist, indptr, indices = graph_to_csr(G)
+    triangles = list_triangles(indptr, indices)
+    assert np.all(triangles[:, :-1] < triangles[:, 1:])
+    assert set(map(frozenset, triangles.tolist())) == set(
+        map(frozenset, xgi.find_triangles(G))
+    )
+
+    # sampling
+    assert list_triangles(indptr, indices, p=0).shape == (0, 3)
+    assert np.array_equal(list_triangles(indptr, indices, p=1), triangles)
+    rng1 = np.random.default_rng(1)
+    rng2 = np.random.default_rng(1)
+    sample = list_triangles(indptr, indices, p=0.5, rng=rng1)
+    assert 0 < len(sample) < len(triangles)
+    assert np.array_equal(sample, list_triangles(indptr, indices, p=0.5, rng=rng2))
+
+    # no edges
+    _, indptr, indices = graph_to_csr(nx.empty_graph(3))
+    assert list_triangles(indptr, indices).shape == (0, 3)
+
+
+def test_list_triangles_blocks(monkeypatch):
+    G = nx.erdos_renyi_graph(50, 0.3, seed=2)
+    _, indptr, indices = graph_to_csr(G)
+    triangles = list_triangles(indptr, indices)
+    sample = list_triangles(indptr, indices, p=0.3, rng=np.random.default_rng(4))
+
+    # the wedges are closed and sampled block by block
+    monkeypatch.setattr(xgi.utils._cliques, "_WEDGE_BLOCK", 10)
+    assert np.array_equal(list_triangles(indptr, indices), triangles)
+    assert np.array_equal(
+        list_triangles(indptr, indices, p=0.3, rng=np.random.default_rng(4)), sample
+    )
+
+
+def test_max_cliques():
+    G = nx.Graph([(0, 1), (1, 2), (2, 0), (0, 3), (2, 3), (3, 4)])
+    G.add_node(5)
+    _, indptr, indices = graph_to_csr(G)
+    cliques = sorted(sorted(c) for c in max_cliques(indptr, indices))
+    assert cliques == [[0, 1, 2], [0, 2, 3], [3, 4], [5]]
+
+    # no nodes
+    _, indptr, indices = graph_to_csr(nx.Graph())
+    assert list(max_cliques(indptr, indices)) == []
+
+
+def test_max_cliques_local_bitsets(monkeypatch):
+    G = nx.erdos_renyi_graph(60, 0.2, seed=3)
+    G.add_node(60)
+    _, indptr, indices = graph_to_csr(G)
+    packed = sorted(sorted(c) for c in max_cliques(indptr, indices))
+
+    # sparse graphs use bitsets over the neighbours of each node
+    monkeypatch.setattr(xgi.utils._cliques, "_PACKED_MAX_NODES", 0)
+    local = sorted(sorted(c) for c in max_cliques(indptr, indices))
+    assert local == packed
+    assert local == sorted(sorted(c) for c in nx.find_cliques(G))
+
+
+def test_max_cliques_hubs():
+    # the leaves of a star only share the hub, whose row is looked up
+    # instead of read in full in each of their subproblems
+    G = nx.star_graph(3000)
+    nx.add_path(G, range(1, 3001))
+    _, indptr, indices = graph_to_csr(G)
+    cliques = sorted(sorted(c) for c in max_cliques(indptr, indices))
+    assert cliques == [[0, i, i + 1] for i in range(1, 3000)]
+
+    G = nx.star_graph(20000)
+    assert len(list(find_cliques_fast(G))) == 20000
+
+
+def test_packed_adjacency():
+    G = nx.empty_graph(71)
+    G.add_edges_from([(0, 1), (1, 2), (2, 0), (2, 70)])
+    _, indptr, indices = graph_to_csr(G)
+    adj = _packed_adjacency(indptr, indices)
+    assert adj[0] == 0b110
+    assert adj[2] == 0b11 | 1 << 70
+    assert adj[70] == 0b100
+    assert adj[3] == 0
+
+
+def test_find_cliques_fast():
+    G = nx.erdos_renyi_graph(40, 0.4, seed=1)
+    G.add_node("a")
+    cliques = list(find_cliques_fast(G))
+    assert len(cliques) == len(set(map(frozenset, cliques)))
+    assert set(map(frozenset, cliques)) == set(map(frozenset, nx.find_cliques(G)))
+
+
+def test_degeneracy_ordering():
+    # a triangle with a pendant node
+    G = nx.Graph([(0, 1), (1, 2), (2, 0), (2, 3)])
+    _, indptr, indices = graph_to_csr(G)
+    order = degeneracy_ordering(indptr, indices)
+    assert order[0] == 3
+    assert sorted(order) == [0, 1, 2, 3]
+
+    # each node has at most k later neighbours, where k is the degeneracy
+    G = nx.erdos_renyi_graph(50, 0.2, seed=2)
+    _, indptr, indices = graph_to_csr(G)
+    order = degeneracy_ordering(indptr, indices)
+    rank = np.empty(len(order), dtype=int)
+    rank[order] = np.arange(len(order))
+    later = [np.sum(rank[indices[indptr[v] : indptr[v + 1]]] > rank[v]) for v in order]
+    assert max(later) == max(nx.core_number(G).values())
+
+    _, indptr, indices = graph_to_csr(nx.Graph())
+    assert degeneracy_ordering(indptr, indices) == []
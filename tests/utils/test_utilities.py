@@ -1,9 +1,20 @@
+from itertools import combinations
+
 import networkx as nx
+import numpy as np
 import pytest
 from numpy import infty
+from scipy.special import comb
 
 import xgi
 from xgi.exception import IDNotFound, XGIError
+from xgi.utils.utilities import (
+    _combination_indices,
+    _pascal_table,
+    _sample_ranks,
+    _unique_rows,
+    _unrank_combinations,
+)
 
 
 def test_iddict(edgelist1):
@@ -274,3 +285,68 @@ def test_convert_labels_to_integers(
 
     assert DH1.nodes[0]["label"] == "a"
     assert DH1.edges[0]["label"] == "e1"
+
+
+def test_combination_indices():
+    idx = _combination_indices(4, 2)
+    assert idx.tolist() == [list(c) for c in combinations(range(4), 2)]
+    assert not idx.flags.writeable
+
+    cliques = np.array([[1, 3, 5], [2, 4, 6]])
+    assert cliques[:, _combination_indices(3, 2)].reshape(-1, 2).tolist() == [
+        [1, 3],
+        [1, 5],
+        [3, 5],
+        [2, 4],
+        [2, 6],
+        [4, 6],
+    ]
+
+
+def test_unique_rows():
+    a = np.array([[2, 3], [0, 1], [2, 3], [0, 2]])
+    assert _unique_rows(a).tolist() == [[0, 1], [0, 2], [2, 3]]
+
+    # rows that do not fit in a single integer
+    b = a * 2**40
+    assert _unique_rows(b).tolist() == (_unique_rows(a) * 2**40).tolist()
+
+    assert _unique_rows(np.empty((0, 3), dtype=int)).shape == (0, 3)
+
+
+def test_sample_ranks():
+    rng = np.random.default_rng(0)
+    ranks = _sample_ranks(10**12, 1000, rng)
+    assert len(set(ranks.tolist())) == 1000
+    assert ranks.min() >= 0
+    assert ranks.max() < 10**12
+
+    assert sorted(_sample_ranks(5, 5, rng).tolist()) == [0, 1, 2, 3, 4]
+    assert _sample_ranks(5, 0, rng).shape == (0,)
+
+    ranks1 = _sample_ranks(100, 10, np.random.default_rng(1))
+    ranks2 = _sample_ranks(100, 10, np.random.default_rng(1))
+    assert np.array_equal(ranks1, ranks2)
+
+
+def test_unrank_combinations():
+    binom = _pascal_table(7, 3)
+    assert binom[7, 3] == 35
+    assert binom[2, 3] == 0
+    with pytest.raises(ValueError):
+        _pascal_table(10**6, 5)
+
+    # largest table below 2**63, where all the additions are exact
+    binom = _pascal_table(66, 33)
+    assert int(binom[66, 33]) == comb(66, 33, exact=True)
+    with pytest.raises(ValueError):
+        _pascal_table(67, 33)
+
+    combs = _unrank_combinations(np.arange(35), 3, binom)
+    assert combs.shape == (35, 3)
+    assert set(map(frozenset, combs.tolist())) == set(
+        map(frozenset, combinations(range(7), 3))
+    )
+    assert np.all(combs[:, :-1] > combs[:, 1:])
+
+    assert _unrank_combinations([], 3, binom).shape == (0, 3)
@@ -7,13 +7,21 @@ Multi-simplices are not allowed.
 
 """
 
+from collections import defaultdict
 from collections.abc import Hashable, Iterable
 from copy import copy, deepcopy
 from itertools import combinations, count
 from warnings import warn
 
+import numpy as np
+
 from ..exception import XGIError, frozen
-from ..utils.utilities import powerset, update_uid_counter
+from ..utils.utilities import (
+    _combination_indices,
+    _unique_rows,
+    powerset,
+    update_uid_counter,
+)
 from .hypergraph import Hypergraph
 from .views import EdgeView, NodeView
 
@@ -644,6 +652,82 @@ class SimplicialComplex(Hypergraph):
 
             self._add_face(members)
 
+    def add_simplices_from_arrays(self, sizes, flat):
+        """Add multiple simplices given by the flat array of their members.
+
+        Equivalent to `add_simplices_from` with simplices specified by their
+        members only, but faster for many simplices: the subfaces of all the
+        simplices of the same size are computed and deduplicated at once with
+        array operations, and the existing simplices are looked up in a set.
+
+        Parameters
+        ----------
+        sizes : array-like of int
+            Number of members of each simplex
+        flat : array-like
+            Members of all the simplices, one simplex after the other, such
+            that the first `sizes[0]` elements are the members of the first
+            simplex, the next `sizes[1]` those of the second one, and so on.
+
+        Raises
+        ------
+        XGIError
+            If the sizes do not add up to the length of `flat`.
+
+        See Also
+        --------
+        add_simplices_from : add a collection of simplices
+
+        Notes
+        -----
+        Adding the same simplex twice will add it only once. Empty simplices
+        are skipped. The simplices get numeric IDs in the order they are given,
+        and their subfaces that do not exist yet get the next IDs.
+
+        Examples
+        --------
+        >>> import xgi
+        >>> S = xgi.SimplicialComplex()
+        >>> S.add_simplices_from_arrays([2, 3], [0, 1, 2, 3, 4])
+        >>> S.edges.members(dtype=dict) # doctest: +SKIP
+        {0: frozenset({0, 1}), 1: frozenset({2, 3, 4}), 2: frozenset({2, 3}), 3: frozenset({2, 4}), 4: frozenset({3, 4})}
+
+        """
+        sizes = np.asarray(sizes, dtype=np.int64).reshape(-1)
+        members = flat.tolist() if isinstance(flat, np.ndarray) else list(flat)
+        if sizes.sum() != len(members):
+            raise XGIError("The sizes must add up to the number of members.")
+
+        ends = np.cumsum(sizes)
+        starts = ends - sizes
+
+        existing = set(self._edge.values())
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            simplex = frozenset(members[start:end])
+            if simplex and simplex not in existing:
+                existing.add(simplex)
+                self._add_face(simplex)
+
+        # relabel the members as 0, 1, ... to compute the subfaces as arrays
+        index = {}
+        codes = np.array(
+            [index.setdefault(n, len(index)) for n in members], dtype=np.int64
+        )
+        labels = list(index)
+
+        faces = defaultdict(list)
+        for size in np.unique(sizes[sizes > 2]).tolist():
+            rows = np.sort(codes[starts[sizes == size, None] + np.arange(size)])
+            for k in range(2, size):
+                faces[k].append(rows[:, _combination_indices(size, k)].reshape(-1, k))
+
+        for k in sorted(faces, reverse=True):
+            for face in _unique_rows(np.concatenate(faces[k])).tolist():
+                simplex = frozenset([labels[i] for i in face])
+                if simplex not in existing:
+                    existing.add(simplex)
+                    self._add_face(simplex)
+
     def close(self):
         """Adds all missing subfaces to the complex.
 
@@ -824,12 +908,18 @@ class SimplicialComplex(Hypergraph):
 
         """
         cp = self.__class__()
-        nn = self.nodes
-        cp.add_nodes_from((n, deepcopy(attr)) for n, attr in nn.items())
-        ee = self.edges
-        cp.add_simplices_from(
-            (e, id, deepcopy(self.edges[id]))
-            for id, e in ee.members(dtype=dict).items()
+        # the simplices are already closed under subfaces, so the internal
+        # dictionaries are filled directly instead of adding every simplex
+        # again, which would check for all its subfaces
+        cp._node.update((n, set(ids)) for n, ids in self._node.items())
+        cp._node_attr.update(
+            (n, deepcopy(attr) if attr else self._node_attr_dict_factory())
+            for n, attr in self._node_attr.items()
+        )
+        cp._edge.update(self._edge)
+        cp._edge_attr.update(
+            (id, deepcopy(attr) if attr else self._hyperedge_attr_dict_factory())
+            for id, attr in self._edge_attr.items()
         )
         cp._hypergraph = deepcopy(self._hypergraph)
 
@@ -901,6 +991,7 @@ class SimplicialComplex(Hypergraph):
         self.remove_nodes_from = frozen
         self.add_simplex = frozen
         self.add_simplices_from = frozen
+        self.add_simplices_from_arrays = frozen
         self.add_weighted_simplices_from = frozen
         self.remove_simplex_id = frozen
         self.remove_simplex_ids_from = frozen
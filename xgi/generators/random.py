@@ -3,11 +3,10 @@ import math
 import random
 import warnings
 from collections import defaultdict
-from itertools import combinations
 
 import numpy as np
-from scipy.special import comb
 
+from ..utils.utilities import _pascal_table, _unrank_combinations
 from .classic import empty_hypergraph
 from .lattice import ring_lattice
 
@@ -45,6 +44,13 @@ def random_hypergraph(N, ps, order=None, seed=None):
     Hypergraph object
         The generated hypergraph
 
+    Raises
+    ------
+    ValueError
+        If an element of `ps` is not between 0 and 1, if `order` is given
+        and `ps` has more than one element, or if the number of potential
+        hyperedges at some order does not fit in a 64-bit integer.
+
     References
     ----------
     Described as 'random hypergraph' by M. Dewar et al. in https://arxiv.org/abs/1703.07686
@@ -62,12 +68,16 @@ def random_hypergraph(N, ps, order=None, seed=None):
         if len(ps) != 1:
             raise ValueError("ps must contain a single element if order is an int")
 
-    if (np.any(np.array(ps) < 0)) or (np.any(np.array(ps) > 1)):
+    ps_array = np.asarray(ps, dtype=float)
+    if ((ps_array < 0) | (ps_array > 1)).any():
         raise ValueError("All elements of ps must be between 0 and 1 included.")
 
     nodes = range(N)
     hyperedges = []
 
+    max_order = order if order is not None else len(ps)
+    binom = _pascal_table(N, max_order + 1)
+
     for i, p in enumerate(ps):
 
         if order is not None:
@@ -75,13 +85,15 @@ def random_hypergraph(N, ps, order=None, seed=None):
         else:
             d = i + 1  # order, ps[0] is prob of edges (d=1)
 
-        potential_edges = combinations(nodes, d + 1)
-        n_comb = comb(N, d + 1, exact=True)
+        n_comb = binom[N, d + 1]
         mask = np.random.random(size=n_comb) <= p  # True if edge to keep
 
-        edges_to_add = [e for e, val in zip(potential_edges, mask) if val]
+        # the i-th combination in lexicographic order is the complement
+        # of the (n_comb - 1 - i)-th one in colexicographic order
+        idxs = n_comb - 1 - np.flatnonzero(mask)
+        edges_to_add = N - 1 - _unrank_combinations(idxs, d + 1, binom)
 
-        hyperedges += edges_to_add
+        hyperedges += map(tuple, edges_to_add.tolist())
 
     H = empty_hypergraph()
     H.add_nodes_from(nodes)
@@ -4,16 +4,24 @@ All the functions in this module return a SimplicialComplex class.
 
 """
 
-import random
+import os
 from collections import defaultdict
-from itertools import combinations
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice, repeat
+from numbers import Integral
 
-import networkx as nx
 import numpy as np
-from scipy.special import comb
 
 from ..core import SimplicialComplex
-from ..utils.utilities import find_triangles
+from ..utils._cliques import edges_to_csr, graph_to_csr, list_triangles, max_cliques
+from ..utils.utilities import (
+    _combination_indices,
+    _pascal_table,
+    _sample_ranks,
+    _unique_rows,
+    _unrank_combinations,
+)
 
 __all__ = [
     "random_simplicial_complex",
@@ -23,8 +31,11 @@ __all__ = [
     "flag_complex_d2",
 ]
 
+# number of maximal cliques whose subcliques are gathered at once in flag_complex
+_CLIQUE_BATCH = 2**12
 
-def random_simplicial_complex(N, ps, seed=None):
+
+def random_simplicial_complex(N, ps, seed=None, n_jobs=1):
     """Generates a random hypergraph
 
     Generate N nodes, and connect any d+1 nodes
@@ -42,12 +53,27 @@ def random_simplicial_complex(N, ps, seed=None):
         of any triangles (3 nodes).
     seed : int or None (default)
         The seed for the random number generator
+    n_jobs : int, default: 1
+        Number of threads used to sample the orders in parallel. As in joblib,
+        negative values count from the number of processors: -1 uses one
+        thread per processor, -2 all the processors but one, and so on,
+        with at least one thread. If the number of processors is unknown,
+        it is taken to be 1.
+        Each order has its own random stream, so the output does not depend
+        on `n_jobs`.
 
     Returns
     -------
     Simplicialcomplex object
         The generated simplicial complex
 
+    Raises
+    ------
+    ValueError
+        If an element of `ps` is not between 0 and 1, if `n_jobs` is 0
+        or not an integer, or if the number of potential simplices at some
+        order does not fit in a 64-bit integer.
+
     References
     ----------
     Described as 'random simplicial complex' in
@@ -62,29 +88,39 @@ def random_simplicial_complex(N, ps, seed=None):
 
     """
 
-    if seed is not None:
-        np.random.seed(seed)
-
-    if (np.any(np.array(ps) < 0)) or (np.any(np.array(ps) > 1)):
+    ps_array = np.asarray(ps, dtype=float)
+    if ((ps_array < 0) | (ps_array > 1)).any():
         raise ValueError("All elements of ps must be between 0 and 1 included.")
 
-    nodes = range(N)
-    simplices = []
+    if not isinstance(n_jobs, Integral) or n_jobs == 0:
+        raise ValueError("n_jobs must be a non-zero integer.")
+    if n_jobs < 0:
+        n_jobs = max((os.cpu_count() or 1) + 1 + n_jobs, 1)
 
-    for i, p in enumerate(ps):
-        d = i + 1  # order, ps[0] is prob of edges (d=1)
+    nodes = range(N)
 
-        potential_simplices = combinations(nodes, d + 1)
-        n_comb = comb(N, d + 1, exact=True)
-        mask = np.random.random(size=n_comb) <= p  # True if simplex to keep
+    # independent streams, one per order, ps[0] is prob of edges (d=1)
+    rngs = [
+        np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(len(ps))
+    ]
+    orders = range(1, len(ps) + 1)
+    binom = _pascal_table(N, len(ps) + 1)
 
-        simplices_to_add = [e for e, val in zip(potential_simplices, mask) if val]
+    if n_jobs == 1 or len(ps) < 2:
+        results = map(_sample_simplices, orders, ps, repeat(binom), rngs)
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            results = list(
+                executor.map(_sample_simplices, orders, ps, repeat(binom), rngs)
+            )
 
-        simplices += simplices_to_add
+    results = list(results)
+    sizes = np.repeat([d + 1 for d in orders], [len(s) for s in results])
 
     S = SimplicialComplex()
     S.add_nodes_from(nodes)
-    S.add_simplices_from(simplices)
+    if results:
+        S.add_simplices_from_arrays(sizes, np.concatenate(results, axis=None))
 
     return S
 
@@ -97,8 +133,9 @@ def flag_complex(G, max_order=2, ps=None, seed=None):
     ----------
     G : Networkx Graph
 
-    max_order : int
-        maximal dimension of simplices to add to the output simplicial complex
+    max_order : int or None
+        maximal dimension of simplices to add to the output simplicial complex.
+        If None, fill all the cliques.
     ps: list of float
         List of probabilities (between 0 and 1) to create a
         hyperedge from a clique, at each order d. For example,
@@ -125,32 +162,17 @@ def flag_complex(G, max_order=2, ps=None, seed=None):
     # defined.  Otherwise, a circular import error would happen.
     from ..core import SimplicialComplex
 
-    if seed is not None:
-        random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     nodes = G.nodes()
-    N = len(nodes)
     edges = G.edges()
 
-    cliques_to_add = _cliques_to_fill(G, max_order)
-
     S = SimplicialComplex()
     S.add_nodes_from(nodes)
-    S.add_simplices_from(edges)
-    if not ps:  # promote all cliques
-        S.add_simplices_from(cliques_to_add, max_order=max_order)
-        return S
-
-    # store max cliques per order
-    cliques_d = defaultdict(list)
-    for x in cliques_to_add:
-        cliques_d[len(x)].append(x)
-
-    # promote cliques with a given probability
-    for i, p in enumerate(ps[: max_order - 1]):
-        d = i + 2  # simplex order
-        cliques_d_to_add = [el for el in cliques_d[d + 1] if random.random() <= p]
-        S.add_simplices_from(cliques_d_to_add, max_order=max_order)
+    S.add_simplices_from_arrays(np.full(len(edges), 2), chain.from_iterable(edges))
+
+    nodelist, indptr, indices = graph_to_csr(G)
+    _fill_cliques(S, nodelist, indptr, indices, max_order, ps, rng)
 
     return S
 
@@ -185,24 +207,17 @@ def flag_complex_d2(G, p2=None, seed=None):
     # defined.  Otherwise, a circular import error would happen.
     from ..core import SimplicialComplex
 
-    if seed is not None:
-        random.seed(seed)
+    rng = np.random.default_rng(seed)
 
     nodes = G.nodes()
     edges = G.edges()
 
     S = SimplicialComplex()
     S.add_nodes_from(nodes)
-    S.add_simplices_from(edges)
-
-    triangles_empty = find_triangles(G)
-
-    if p2 is not None:
-        triangles = [el for el in triangles_empty if random.random() <= p2]
-    else:
-        triangles = triangles_empty
+    S.add_simplices_from_arrays(np.full(len(edges), 2), chain.from_iterable(edges))
 
-    S.add_simplices_from(triangles)
+    nodelist, indptr, indices = graph_to_csr(G)
+    _fill_triangles(S, nodelist, indptr, indices, p2, rng)
 
     return S
 
@@ -232,18 +247,25 @@ def random_flag_complex_d2(N, p, seed=None):
     Computing all cliques quickly becomes heavy for large networks.
 
     """
-    if seed is not None:
-        random.seed(seed)
+    # This import needs to happen when this function is called, not when it is
+    # defined.  Otherwise, a circular import error would happen.
+    from ..core import SimplicialComplex
 
     if (p < 0) or (p > 1):
         raise ValueError("p must be between 0 and 1 included.")
 
-    G = nx.fast_gnp_random_graph(N, p, seed=seed)
+    rng = np.random.default_rng(seed)
+    indptr, indices = _gnp_csr(N, p, rng)
+
+    S = SimplicialComplex()
+    S.add_nodes_from(range(N))
+    _add_simplices(S, range(N), _csr_edges(indptr, indices))
+    _fill_triangles(S, range(N), indptr, indices, None, rng)
 
-    return flag_complex_d2(G)
+    return S
 
 
-def random_flag_complex(N, p, max_order=2, seed=None):
+def random_flag_complex(N, p, max_order=2, seed=None, cache=False):
     """Generate a flag (or clique) complex from a
     :math:`G_{N,p}` Erdős-Rényi random graph.
 
@@ -260,6 +282,11 @@ def random_flag_complex(N, p, max_order=2, seed=None):
         maximal dimension of simplices to add to the output simplicial complex
     seed : int or None (default)
         The seed for the random number generator
+    cache : bool, default: False
+        Whether to keep the simplicial complex generated for the same `N`, `p`,
+        `max_order`, and `seed`, so that calling this function again with the
+        same arguments only has to copy it. Only used if `seed` is an integer:
+        a Generator or a SeedSequence gives different draws at every call.
 
     Returns
     -------
@@ -270,53 +297,352 @@ def random_flag_complex(N, p, max_order=2, seed=None):
     Computing all cliques quickly becomes heavy for large networks.
 
     """
+    # This import needs to happen when this function is called, not when it is
+    # defined.  Otherwise, a circular import error would happen.
+    from ..core import SimplicialComplex
+
     if (p < 0) or (p > 1):
         raise ValueError("p must be between 0 and 1 included.")
 
-    G = nx.fast_gnp_random_graph(N, p, seed=seed)
-
-    nodes = G.nodes()
+    if cache and isinstance(seed, Integral):
+        return _cached_random_flag_complex(N, p, max_order, int(seed)).copy()
 
-    cliques = _cliques_to_fill(G, max_order)
+    rng = np.random.default_rng(seed)
+    indptr, indices = _gnp_csr(N, p, rng)
 
     S = SimplicialComplex()
-    S.add_nodes_from(nodes)
-    S.add_simplices_from(cliques, max_order=max_order)
+    S.add_nodes_from(range(N))
+    _add_simplices(S, range(N), _csr_edges(indptr, indices))
+    _fill_cliques(S, range(N), indptr, indices, max_order, None, rng)
 
     return S
 
 
-def _cliques_to_fill(G, max_order):
-    """Return cliques to fill for flag complexes,
-    to be passed to `add_simplices_from`.
+@lru_cache(maxsize=128)
+def _cached_random_flag_complex(N, p, max_order, seed):
+    """Return the frozen output of `random_flag_complex` for an integer seed.
 
-    This function was written to speedup flag_complex functions
-    by avoiding adding redundant faces.
+    Parameters
+    ----------
+    N : int
+        Number of nodes
+    p : float
+        Probability (between 0 and 1) to create an edge
+        between any 2 nodes
+    max_order : int
+        maximal dimension of simplices to add to the output simplicial complex
+    seed : int
+        The seed for the random number generator
+
+    Returns
+    -------
+    SimplicialComplex
+        Frozen simplicial complex, to be copied before being returned to the user
+
+    """
+    S = random_flag_complex(N, p, max_order=max_order, seed=seed)
+    S.freeze()
+    return S
+
+
+def _fill_cliques(S, nodelist, indptr, indices, max_order, ps, rng):
+    """Add the cliques of a graph in CSR format to a simplicial complex.
 
     Parameters
     ----------
-    G : networkx Graph
-        Graph to consider
-    max_order: int or None
-        If None, return maximal cliques. If int, return all cliques
-        up to max_order.
+    S : SimplicialComplex
+        Simplicial complex to fill, modified in place
+    nodelist : sequence
+        Node labels, such that node i in the CSR arrays is nodelist[i]
+    indptr : numpy.ndarray
+        Index pointers of the CSR arrays
+    indices : numpy.ndarray
+        Sorted neighbours of each node
+    max_order : int or None
+        maximal dimension of simplices to add. If None, fill all the cliques.
+    ps : list of float or None
+        List of probabilities (between 0 and 1) to promote a clique at each
+        order d, starting at d=2. If None, promote all cliques.
+    rng : numpy.random.Generator
+        Random number generator
+
+    See also
+    --------
+    flag_complex
+
+    """
+    if not ps:
+        if max_order is None:  # promote all maximal cliques
+            cliques = list(max_cliques(indptr, indices))
+            S.add_simplices_from_arrays(
+                [len(clique) for clique in cliques],
+                [nodelist[i] for clique in cliques for i in clique],
+            )
+            return
+        ps = [1] * (max_order - 1)  # promote all cliques
+    elif max_order is None:
+        max_order = len(ps) + 1
+    max_size = min(max_order, len(ps) + 1) + 1  # of the cliques to promote
+
+    # each subclique is promoted if a hash of its nodes, seeded by rng, falls
+    # below the probability of its size. A subclique shared by several maximal
+    # cliques thus gets a single draw, without keeping track of the subcliques
+    # seen so far, and the maximal cliques can be streamed in batches.
+    key = rng.integers(2**64, dtype=np.uint64)
+    promoted = {}  # distinct promoted subcliques of each size
+    pending = defaultdict(list)  # promoted subcliques not deduplicated yet
+    cliques = max_cliques(indptr, indices)
+    while True:
+        batch = list(islice(cliques, _CLIQUE_BATCH))
+        if not batch:
+            break
+        batch = [clique for clique in batch if len(clique) > 2]
+        if not batch:
+            continue
+
+        # group the batch by size, as arrays of sorted node indices
+        sizes = np.fromiter(map(len, batch), dtype=np.int64, count=len(batch))
+        order = np.argsort(sizes, kind="stable")
+        bounds = np.flatnonzero(np.diff(sizes[order])) + 1
+        groups = [
+            np.sort(np.array([batch[i] for i in idx]), axis=1)
+            for idx in np.split(order, bounds)
+        ]
+
+        # gather the subcliques of each size with index templates
+        for size in range(3, max_size + 1):
+            p = ps[size - 3]
+            if p <= 0:
+                continue
+            for group in groups:
+                n = group.shape[1]
+                if n < size:
+                    continue
+                subcliques = group[:, _combination_indices(n, size)].reshape(-1, size)
+                if p < 1:
+                    subcliques = subcliques[_uniform_hash(subcliques, key) < p]
+                pending[size].append(subcliques)
+
+        # subcliques shared by several maximal cliques are promoted once per
+        # occurrence, so the pending ones are deduplicated as soon as they
+        # outnumber the distinct ones, which bounds the memory by the output
+        for size, rows in pending.items():
+            if sum(map(len, rows)) >= len(promoted.get(size, ())):
+                _merge_rows(promoted, size, rows)
+
+    for size, rows in pending.items():
+        _merge_rows(promoted, size, rows)
+    for size in sorted(promoted):
+        _add_simplices(S, nodelist, promoted[size])
+
+
+def _merge_rows(promoted, size, rows):
+    """Deduplicate pending rows into the distinct rows of a given size.
+
+    Parameters
+    ----------
+    promoted : dict
+        Distinct rows of each size, modified in place
+    size : int
+        Size of the rows
+    rows : list of numpy.ndarray
+        Pending rows of that size, emptied in place
+
+    """
+    if size in promoted:
+        rows.append(promoted[size])
+    promoted[size] = _unique_rows(np.concatenate(rows))
+    rows.clear()
+
+
+def _uniform_hash(rows, key):
+    """Return a number in [0, 1) for each row of an array, as a hash of the row.
+
+    The rows are hashed with the SplitMix64 mixing function, so that the
+    numbers are independent and uniformly distributed across distinct rows
+    and keys, and equal for equal rows.
+
+    Parameters
+    ----------
+    rows : numpy.ndarray
+        Array of shape (m, k) of non-negative integers
+    key : numpy.uint64
+        Key of the hash function
 
     Returns
     -------
-    cliques : list
-        List of cliques
+    numpy.ndarray
+        Array of shape (m,) of floats in [0, 1)
+
+    References
+    ----------
+    G. L. Steele, D. Lea, C. H. Flood,
+    "Fast splittable pseudorandom number generators",
+    OOPSLA 2014, 453-472 (2014).
+    https://doi.org/10.1145/2660193.2660195
+
+    """
+    h = np.full(len(rows), key, dtype=np.uint64)
+    for col in rows.T:
+        h ^= col.astype(np.uint64)
+        h += np.uint64(0x9E3779B97F4A7C15)
+        h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        h ^= h >> np.uint64(31)
+    return (h >> np.uint64(11)) * 2.0**-53
+
+
+def _fill_triangles(S, nodelist, indptr, indices, p2, rng):
+    """Add the triangles of a graph in CSR format to a simplicial complex.
+
+    Parameters
+    ----------
+    S : SimplicialComplex
+        Simplicial complex to fill, modified in place
+    nodelist : sequence
+        Node labels, such that node i in the CSR arrays is nodelist[i]
+    indptr : numpy.ndarray
+        Index pointers of the CSR arrays
+    indices : numpy.ndarray
+        Sorted neighbours of each node
+    p2 : float or None
+        Probability (between 0 and 1) of filling each triangle.
+        If None, fill all triangles.
+    rng : numpy.random.Generator
+        Random number generator
+
+    See also
+    --------
+    flag_complex_d2
+
+    """
+    # empty triangles are filled with probability p2 as they are found
+    triangles = list_triangles(indptr, indices, p=p2, rng=rng)
+    _add_simplices(S, nodelist, triangles)
+
+
+def _add_simplices(S, nodelist, simplices):
+    """Add simplices given by node indices to a simplicial complex.
+
+    Parameters
+    ----------
+    S : SimplicialComplex
+        Simplicial complex to fill, modified in place
+    nodelist : sequence
+        Node labels, such that node i is nodelist[i]
+    simplices : numpy.ndarray
+        Array of shape (num_simplices, size) with the node indices of
+        each simplex
+
+    """
+    flat = simplices.ravel()
+    if not isinstance(nodelist, range) or nodelist.start != 0:
+        flat = [nodelist[i] for i in flat.tolist()]
+    S.add_simplices_from_arrays(np.full(len(simplices), simplices.shape[1]), flat)
+
+
+def _gnp_csr(N, p, rng):
+    """Return the adjacency of a :math:`G_{N,p}` random graph in CSR format.
+
+    The pairs of nodes are ranked in colexicographic order and the gaps
+    between the ranks of consecutive edges are drawn from a geometric
+    distribution, so that the work is proportional to the number of edges
+    instead of the number of pairs.
+
+    Parameters
+    ----------
+    N : int
+        Number of nodes
+    p : float
+        Probability (between 0 and 1) to create an edge
+        between any 2 nodes
+    rng : numpy.random.Generator
+        Random number generator
+
+    Returns
+    -------
+    indptr : numpy.ndarray
+        Index pointers of the CSR arrays
+    indices : numpy.ndarray
+        Sorted neighbours of each node
+
+    References
+    ----------
+    V. Batagelj and U. Brandes,
+    "Efficient generation of large random networks",
+    Phys. Rev. E 71, 036113 (2005).
+    https://doi.org/10.1103/PhysRevE.71.036113
 
     """
-    if max_order is None:
-        cliques = list(nx.find_cliques(G))  # max cliques
-    else:  # avoid adding many unnecessary redundant cliques
-        cliques = []
-        for clique in nx.enumerate_all_cliques(G):  # sorted by size
-            if len(clique) == 1:
-                continue  # don't add singletons
-            if len(clique) <= max_order + 1:
-                cliques.append(clique)
-            else:
-                break  # dont go over whole list if not necessary
-
-    return cliques
+    n_pairs = N * (N - 1) // 2
+
+    if p == 0 or n_pairs == 0:
+        idxs = np.empty(0, dtype=np.int64)
+    elif p == 1:
+        idxs = np.arange(n_pairs)
+    else:
+        # draw gaps in batches a bit larger than the expected number of edges
+        batch = int(n_pairs * p + 3 * np.sqrt(n_pairs * p * (1 - p))) + 1
+        idxs = []
+        last = -1
+        while last < n_pairs:
+            ranks = last + np.cumsum(rng.geometric(p, size=batch))
+            idxs.append(ranks)
+            last = ranks[-1]
+        idxs = np.concatenate(idxs)
+        idxs = idxs[idxs < n_pairs]
+
+    edges = _unrank_combinations(idxs, 2, _pascal_table(N, 2))
+    return edges_to_csr(N, edges)
+
+
+def _csr_edges(indptr, indices):
+    """Return the edges of a graph in CSR format.
+
+    Parameters
+    ----------
+    indptr : numpy.ndarray
+        Index pointers of the CSR arrays
+    indices : numpy.ndarray
+        Sorted neighbours of each node
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (m, 2) where each row u, v is an edge with u < v.
+
+    """
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    fwd = rows < indices
+    return np.column_stack((rows[fwd], indices[fwd]))
+
+
+def _sample_simplices(d, p, binom, rng):
+    """Sample each simplex of order d with probability p.
+
+    The number of simplices is drawn first, then their ranks, without
+    enumerating all the potential simplices.
+
+    Parameters
+    ----------
+    d : int
+        Order of the simplices
+    p : float
+        Probability (between 0 and 1) to create each simplex
+    binom : numpy.ndarray
+        Table of binomial coefficients up to N choose d + 1,
+        as returned by `_pascal_table`, where N is the number of nodes.
+    rng : numpy.random.Generator
+        Random number generator
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (num_simplices, d + 1) with the nodes of each simplex
+
+    """
+    n_comb = binom[-1, d + 1]
+    k = rng.binomial(n_comb, p)
+    idxs = _sample_ranks(n_comb, k, rng)
+
+    return _unrank_combinations(idxs, d + 1, binom)
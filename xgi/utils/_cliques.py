@@ -0,0 +1,494 @@
+"""Clique enumeration on graphs in compressed sparse row (CSR) format.
+
+For internal use only. Nodes are the integers 0, ..., n-1 and the
+neighbours of node u are ``indices[indptr[u]:indptr[u + 1]]``, sorted in
+increasing order.
+
+"""
+
+from bisect import bisect_left
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+# graphs with at most this many nodes, and at least one edge per this many
+# pairs of nodes, use the global adjacency bitsets in `max_cliques`
+_PACKED_MAX_NODES = 8192
+_PACKED_MAX_SPARSITY = 512
+
+# number of wedges closed at once in `list_triangles`
+_WEDGE_BLOCK = 2**18
+
+
+def graph_to_csr(G):
+    """Return the adjacency of a networkx Graph in CSR format.
+
+    Parameters
+    ----------
+    G : networkx Graph
+        Graph to consider
+
+    Returns
+    -------
+    nodelist : list
+        Node labels, such that node i in the CSR arrays is nodelist[i]
+    indptr : numpy.ndarray
+        Index pointers of the CSR arrays
+    indices : numpy.ndarray
+        Sorted neighbours of each node, without self-loops
+
+    Notes
+    -----
+    The arrays keep the index dtype chosen by scipy, which is int32 unless
+    the graph is too large for it. The conversion makes a single pass over
+    `G.edges()`, which is faster than `networkx.to_scipy_sparse_array`.
+
+    """
+    nodelist = list(G)
+    index = {node: i for i, node in enumerate(nodelist)}
+    edges = np.array(
+        [(index[u], index[v]) for u, v in G.edges()], dtype=np.int64
+    ).reshape(-1, 2)
+
+    indptr, indices = edges_to_csr(len(nodelist), edges)
+    return nodelist, indptr, indices
+
+
+def edges_to_csr(n, edges):
+    """Return the adjacency of an undirected graph in CSR format.
+
+    Parameters
+    ----------
+    n : int
+        Number of nodes
+    edges : numpy.ndarray
+        Array of shape (m, 2) with the endpoints of each edge
+
+    Returns
+    -------
+    indptr : numpy.ndarray
+        Index pointers of the CSR arrays
+    indices : numpy.ndarray
+        Sorted neighbours of each node, without self-loops
+
+    """
+    edges = edges[edges[:, 0] != edges[:, 1]]
+    rows = np.concatenate([edges[:, 0], edges[:, 1]])
+    cols = np.concatenate([edges[:, 1], edges[:, 0]])
+
+    A = csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(n, n))
+    A.sum_duplicates()
+    A.sort_indices()
+
+    return A.indptr, A.indices
+
+
+def list_triangles(indptr, indices, p=None, rng=None):
+    """Return the triangles of a graph in CSR format.
+
+    Each triangle u < v < w is found once, by closing the wedge formed by
+    the edges (u, v) and (v, w) with a lookup of the edge (u, w). The wedges
+    are built and closed in blocks of about `_WEDGE_BLOCK` wedges. If `p` is
+    given, the triangles of each block are kept with probability `p` before
+    the next block is built, so that memory use is bounded by the block size
+    and the kept triangles.
+
+    Parameters
+    ----------
+    indptr : numpy.ndarray
+        Index pointers of the CSR arrays
+    indices : numpy.ndarray
+        Sorted neighbours of each node
+    p : float or None (default)
+        Probability (between 0 and 1) of keeping each triangle.
+        If None, keep all triangles.
+    rng : numpy.random.Generator or None (default)
+        Random number generator used if `p` is given.
+
+    Returns
+    -------
+    triangles : numpy.ndarray
+        Array of shape (num_triangles, 3) where each row u, v, w
+        is a triangle with u < v < w.
+
+    """
+    n = len(indptr) - 1
+    rows = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+
+    # keep only the neighbours with a larger index
+    fwd = indices > rows
+    f_rows = rows[fwd]
+    f_cols = indices[fwd]
+    f_indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(f_rows, minlength=n), out=f_indptr[1:])
+
+    # edge keys are sorted because rows and columns are
+    keys = f_rows * n + f_cols
+
+    # number of wedges u < v < w formed by each edge (u, v)
+    counts = np.diff(f_indptr)[f_cols]
+    ends = np.cumsum(counts)
+
+    if p is not None and rng is None:
+        rng = np.random.default_rng()
+
+    triangles = [np.empty((0, 3), dtype=np.int64)]
+    start = 0
+    while start < len(f_cols):
+        done = ends[start - 1] if start else 0
+        stop = np.searchsorted(ends, done + _WEDGE_BLOCK, side="right")
+        stop = max(stop, start + 1)  # at least one edge per block
+
+        # the wedges of the edges start, ..., stop - 1, as the edge and the node w
+        c = counts[start:stop]
+        edge = np.repeat(np.arange(start, stop), c)
+        offsets = np.repeat(f_indptr[f_cols[start:stop]] - (np.cumsum(c) - c), c)
+        w = f_cols[offsets + np.arange(len(edge))]
+
+        # close the wedges
+        wedge_keys = f_rows[edge] * n + w
+        pos = np.searchsorted(keys, wedge_keys)
+        closed = pos < len(keys)
+        closed[closed] = keys[pos[closed]] == wedge_keys[closed]
+        tri = np.flatnonzero(closed)
+
+        if p is not None:
+            tri = tri[rng.random(len(tri)) <= p]
+
+        edge = edge[tri]
+        triangles.append(np.column_stack((f_rows[edge], f_cols[edge], w[tri])))
+        start = stop
+
+    return np.concatenate(triangles)
+
+
+def find_cliques_fast(G):
+    """Yield the maximal cliques of a networkx Graph.
+
+    Drop-in replacement for `networkx.find_cliques`, using `max_cliques`
+    on the CSR arrays of the graph.
+
+    Parameters
+    ----------
+    G : networkx Graph
+        Graph to consider
+
+    Yields
+    ------
+    list
+        Nodes of a maximal clique
+
+    """
+    nodelist, indptr, indices = graph_to_csr(G)
+    for clique in max_cliques(indptr, indices):
+        yield [nodelist[i] for i in clique]
+
+
+def max_cliques(indptr, indices):
+    """Yield the maximal cliques of a graph in CSR format.
+
+    Uses the Bron–Kerbosch algorithm with the pivot rule of Tomita et al.,
+    where the candidate and excluded sets are stored as bitsets
+    (Python integers), so that set intersections are bitwise operations.
+    The outer loop goes over the nodes in degeneracy order, as in
+    Eppstein et al.: each node v is the first node of the cliques found
+    with its later neighbours as candidates and its earlier neighbours as
+    excluded nodes. Each of these subproblems only involves the neighbours
+    of v, which keeps the bitsets small on sparse graphs. On small or dense
+    graphs, the adjacency is instead packed once into bitsets over all the
+    nodes, which are shared by all the subproblems.
+
+    Parameters
+    ----------
+    indptr : numpy.ndarray
+        Index pointers of the CSR arrays
+    indices : numpy.ndarray
+        Sorted neighbours of each node
+
+    Yields
+    ------
+    list of int
+        Nodes of a maximal clique
+
+    References
+    ----------
+    E. Tomita, A. Tanaka, H. Takahashi,
+    "The worst-case time complexity for generating all maximal cliques
+    and computational experiments", Theoretical Computer Science 363(1), 28-42 (2006).
+    https://doi.org/10.1016/j.tcs.2006.06.015
+
+    D. Eppstein, M. Löffler, D. Strash,
+    "Listing all maximal cliques in sparse graphs in near-optimal time",
+    Algorithms and Computation, ISAAC 2010, 403-414 (2010).
+    https://doi.org/10.1007/978-3-642-17517-6_36
+
+    """
+    order = degeneracy_ordering(indptr, indices)
+    n = len(order)
+
+    if n <= _PACKED_MAX_NODES and _PACKED_MAX_SPARSITY * len(indices) >= n * n:
+        adj = _packed_adjacency(indptr, indices)
+        done = 0  # nodes whose cliques were all found
+        for v in order:
+            done |= 1 << v
+            if not adj[v]:  # isolated node
+                yield [v]
+                continue
+            cand = adj[v] & ~done  # later neighbours
+            if cand:
+                for clique in _expand(adj, adj[v], cand):
+                    yield [v] + clique
+        return
+
+    rank = [0] * n
+    for i, v in enumerate(order):
+        rank[v] = i
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+
+    for v in order:
+        nbrs = indices[indptr[v] : indptr[v + 1]]
+        if not nbrs:  # isolated node
+            yield [v]
+            continue
+
+        cand = 0  # later neighbours
+        for i, u in enumerate(nbrs):
+            if rank[u] > rank[v]:
+                cand |= 1 << i
+        if not cand:  # all the cliques of v were found already
+            continue
+
+        adj = _local_adjacency(indptr, indices, nbrs, cand)
+        subg = (1 << len(nbrs)) - 1
+        for clique in _expand(adj, subg, cand):
+            yield [v] + [nbrs[i] for i in clique]
+
+
+def degeneracy_ordering(indptr, indices):
+    """Return the nodes of a graph in CSR format in degeneracy order.
+
+    Nodes are repeatedly removed by smallest degree in the remaining graph,
+    using the bucket sort of Batagelj and Zaversnik, in O(n + m) time.
+
+    Parameters
+    ----------
+    indptr : numpy.ndarray
+        Index pointers of the CSR arrays
+    indices : numpy.ndarray
+        Sorted neighbours of each node
+
+    Returns
+    -------
+    list of int
+        Nodes in the order they were removed
+
+    References
+    ----------
+    V. Batagelj, M. Zaversnik,
+    "An O(m) algorithm for cores decomposition of networks",
+    arXiv:cs/0310049 (2003).
+    https://arxiv.org/abs/cs/0310049
+
+    """
+    n = len(indptr) - 1
+    if n == 0:
+        return []
+    indptr = indptr.tolist()
+    indices = indices.tolist()
+    deg = [indptr[u + 1] - indptr[u] for u in range(n)]
+
+    # vert holds the nodes sorted by degree, pos their position in vert, and
+    # start[d] the position in vert of the first node of degree d
+    start = [0] * (max(deg) + 2)
+    for d in deg:
+        start[d + 1] += 1
+    for d in range(1, len(start)):
+        start[d] += start[d - 1]
+    pos = [0] * n
+    vert = [0] * n
+    fill = start[:]
+    for u in range(n):
+        pos[u] = fill[deg[u]]
+        vert[pos[u]] = u
+        fill[deg[u]] += 1
+
+    for i in range(n):
+        v = vert[i]
+        for u in indices[indptr[v] : indptr[v + 1]]:
+            if deg[u] > deg[v]:
+                # swap u with the first node of its bucket, then shrink it
+                du, pu = deg[u], pos[u]
+                pw = start[du]
+                w = vert[pw]
+                if u != w:
+                    pos[u], pos[w] = pw, pu
+                    vert[pu], vert[pw] = w, u
+                start[du] += 1
+                deg[u] -= 1
+
+    return vert
+
+
+def _packed_adjacency(indptr, indices):
+    """Return the adjacency bitsets of a graph in CSR format.
+
+    The adjacency matrix is packed into 64-bit words, one bit per pair of
+    nodes, and each row is then read as a Python integer.
+
+    Parameters
+    ----------
+    indptr : numpy.ndarray
+        Index pointers of the CSR arrays
+    indices : numpy.ndarray
+        Sorted neighbours of each node
+
+    Returns
+    -------
+    adj : list of int
+        Neighbours of each node, as bitsets over the nodes.
+
+    """
+    n = len(indptr) - 1
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    bits = np.left_shift(np.uint64(1), indices.astype(np.uint64) & np.uint64(63))
+
+    words = np.zeros((n, (n + 63) // 64), dtype="<u8")
+    np.bitwise_or.at(words, (rows, indices >> 6), bits)
+    return [int.from_bytes(row.tobytes(), "little") for row in words]
+
+
+def _local_adjacency(indptr, indices, nodes, cand):
+    """Return the adjacency bitsets of the subgraph induced by `nodes`.
+
+    Only the edges with at least one candidate node are needed by the
+    Bron–Kerbosch algorithm, so the rows of the candidate nodes are read
+    and transposed into the rows of the other nodes. The row of a candidate
+    node with more neighbours than `nodes` is not read in full: each node of
+    `nodes` is looked up in it by binary search instead, so that hubs do not
+    cost their degree in every subproblem they appear in.
+
+    Parameters
+    ----------
+    indptr : list of int
+        Index pointers of the CSR arrays
+    indices : list of int
+        Sorted neighbours of each node
+    nodes : list of int
+        Nodes of the subgraph
+    cand : int
+        Bitset of the candidate nodes, over the positions in `nodes`
+
+    Returns
+    -------
+    adj : list of int
+        Neighbours of each node of the subgraph, as bitsets over
+        the positions in `nodes`.
+
+    """
+    local = {u: i for i, u in enumerate(nodes)}
+    adj = [0] * len(nodes)
+    while cand:
+        low = cand & -cand
+        cand ^= low
+        i = low.bit_length() - 1
+        u = nodes[i]
+        lo, hi = indptr[u], indptr[u + 1]
+        if hi - lo <= len(nodes):
+            common = local.keys() & indices[lo:hi]
+        else:
+            common = []
+            for w in nodes:
+                k = bisect_left(indices, w, lo, hi)
+                if k < hi and indices[k] == w:
+                    common.append(w)
+        for w in common:
+            j = local[w]
+            adj[i] |= 1 << j
+            adj[j] |= low
+    return adj
+
+
+def _expand(adj, subg, cand):
+    """Yield the maximal cliques of the Bron–Kerbosch subproblem (P, X).
+
+    This is an iterative version of the recursion with pivoting.
+
+    Parameters
+    ----------
+    adj : list of int
+        Neighbours of each node, as bitsets
+    subg : int
+        Bitset of the candidate and excluded nodes, P | X
+    cand : int
+        Bitset of the candidate nodes, P. Must not be empty.
+
+    Yields
+    ------
+    list of int
+        Nodes of a maximal clique of the subproblem
+
+    """
+    ext = cand & ~adj[_pivot(subg, cand, adj)]  # candidates left to branch on
+    clique = [None]
+    stack = []
+    while True:
+        if ext:
+            low = ext & -ext
+            ext ^= low
+            cand ^= low
+            q = low.bit_length() - 1
+            clique[-1] = q
+            subg_q = subg & adj[q]
+            if not subg_q:
+                yield clique[:]
+            else:
+                cand_q = cand & adj[q]
+                if cand_q:
+                    stack.append((subg, cand, ext))
+                    clique.append(None)
+                    subg, cand = subg_q, cand_q
+                    ext = cand & ~adj[_pivot(subg, cand, adj)]
+        elif stack:
+            clique.pop()
+            subg, cand, ext = stack.pop()
+        else:
+            return
+
+
+def _pivot(subg, cand, adj):
+    """Return the node of `subg` with the most neighbours in `cand`.
+
+    Parameters
+    ----------
+    subg : int
+        Bitset of nodes to choose from
+    cand : int
+        Bitset of candidate nodes
+    adj : list of int
+        Neighbours of each node, as bitsets
+
+    Returns
+    -------
+    int
+        The pivot node
+
+    """
+    best, best_count = -1, -1
+    while subg:
+        low = subg & -subg
+        subg ^= low
+        u = low.bit_length() - 1
+        count = _popcount(cand & adj[u])
+        if count > best_count:
+            best, best_count = u, count
+    return best
+
+
+try:
+    _popcount = int.bit_count  # Python >= 3.10
+except AttributeError:
+
+    def _popcount(bits):
+        """Return the number of set bits of a non-negative integer."""
+        return bin(bits).count("1")
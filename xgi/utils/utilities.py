@@ -5,8 +5,10 @@ from copy import deepcopy
 from functools import lru_cache
 from itertools import chain, combinations, count
 
+import numpy as np
 import requests
 from numpy import infty
+from scipy.special import comb
 
 from xgi.exception import IDNotFound, XGIError
 
@@ -127,6 +129,170 @@ def powerset(
     return chain.from_iterable(combinations(s, r) for r in range(start, len(s) + end))
 
 
+@lru_cache(maxsize=128)
+def _combination_indices(n, k):
+    """Return the positions of the combinations of size `k` of `n` elements.
+
+    Indexing an array of shape (m, n) with the result along its last axis
+    gives all the combinations of each of its m rows at once.
+
+    Parameters
+    ----------
+    n : int
+        Number of elements
+    k : int
+        Size of the combinations
+
+    Returns
+    -------
+    numpy.ndarray
+        Read-only array of shape (n choose k, k) where each row holds
+        increasing positions.
+
+    """
+    idx = np.fromiter(
+        chain.from_iterable(combinations(range(n), k)),
+        dtype=np.int64,
+        count=comb(n, k, exact=True) * k,
+    ).reshape(-1, k)
+    idx.setflags(write=False)
+    return idx
+
+
+def _unique_rows(a):
+    """Return the distinct rows of a 2D array of non-negative integers.
+
+    Equivalent to `np.unique(a, axis=0)`, which sorts the rows as opaque
+    records and is slow. Instead, if they fit in 64 bits, each row is
+    encoded as a single integer in base `a.max() + 1` and those are sorted.
+    Otherwise, the columns are sorted with `np.lexsort`.
+
+    Parameters
+    ----------
+    a : numpy.ndarray
+        Array of shape (m, k)
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (m', k) with the distinct rows of `a`,
+        in lexicographic order.
+
+    """
+    m, k = a.shape
+    base = int(a.max()) + 1 if m else 1
+    if base**k <= np.iinfo(np.int64).max:
+        weights = base ** np.arange(k - 1, -1, -1, dtype=np.int64)
+        _, idx = np.unique(a @ weights, return_index=True)
+        return a[idx]
+
+    a = a[np.lexsort(a.T[::-1])]
+    keep = np.ones(m, dtype=bool)
+    keep[1:] = np.any(a[1:] != a[:-1], axis=1)
+    return a[keep]
+
+
+def _pascal_table(n, k):
+    """Return the table of binomial coefficients up to `n` choose `k`.
+
+    Parameters
+    ----------
+    n : int
+        Largest number of elements to choose from
+    k : int
+        Largest number of elements to choose
+
+    Returns
+    -------
+    binom : numpy.ndarray
+        Array of shape (n + 1, k + 1) such that
+        binom[i, j] is i choose j.
+
+    Raises
+    ------
+    ValueError
+        If the binomial coefficients do not fit in 64-bit integers.
+
+    """
+    if comb(n, min(k, n // 2), exact=True) >= 2**63:
+        raise ValueError(f"{n} choose {k} is too large to be indexed.")
+
+    binom = np.zeros((n + 1, k + 1), dtype=np.int64)
+    binom[:, 0] = 1
+    for i in range(1, n + 1):
+        binom[i, 1:] = binom[i - 1, 1:] + binom[i - 1, :-1]
+    return binom
+
+
+def _unrank_combinations(idxs, r, binom):
+    r"""Return the combinations of size `r` with given ranks.
+
+    Uses the combinatorial number system: the combination
+    :math:`c_r > ... > c_1` has rank :math:`\sum_i \binom{c_i}{i}`.
+
+    Parameters
+    ----------
+    idxs : numpy.ndarray
+        Ranks of the combinations, in colexicographic order
+    r : int
+        Size of the combinations
+    binom : numpy.ndarray
+        Table of binomial coefficients, as returned by `_pascal_table`,
+        with at least r + 1 columns.
+
+    Returns
+    -------
+    combs : numpy.ndarray
+        Array of shape (len(idxs), r) where each row is a combination,
+        in decreasing order.
+
+    """
+    idxs = np.array(idxs, dtype=np.int64)
+    combs = np.empty((len(idxs), r), dtype=np.int64)
+    for j, i in enumerate(range(r, 0, -1)):
+        # largest c such that binom(c, i) <= idx
+        c = np.searchsorted(binom[:, i], idxs, side="right") - 1
+        combs[:, j] = c
+        idxs -= binom[c, i]
+    return combs
+
+
+def _sample_ranks(n, k, rng):
+    """Return `k` distinct integers drawn uniformly from ``range(n)``.
+
+    Uses Floyd's algorithm, which takes O(k) time and memory, whereas
+    `Generator.choice(n, k, replace=False)` permutes all `n` integers
+    unless `k` is much smaller than `n`.
+
+    Parameters
+    ----------
+    n : int
+        Number of integers to choose from
+    k : int
+        Number of integers to choose, at most `n`
+    rng : numpy.random.Generator
+        Random number generator
+
+    Returns
+    -------
+    numpy.ndarray
+        The chosen integers, in no particular order.
+
+    References
+    ----------
+    J. Bentley and R. Floyd, "Programming pearls: a sample of brilliance",
+    Communications of the ACM 30(9), 754-757 (1987).
+
+    """
+    # for each j in n - k, ..., n - 1, draw t in 0, ..., j and keep t,
+    # or j if t was already kept
+    draws = rng.integers(np.arange(n - k, n, dtype=np.int64), endpoint=True)
+    chosen = set()
+    for j, t in zip(range(n - k, n), draws.tolist()):
+        chosen.add(j if t in chosen else t)
+    return np.fromiter(chosen, dtype=np.int64, count=k)
+
+
 def update_uid_counter(H, new_id):
     """
     Helper function to make sure the uid counter is set correctly after